@@ -3,10 +3,14 @@
 Rentry Content Explorer
 
 Discover what's actually posted on rentry.co through random URL exploration.
-Works on Windows, Mac, and Linux with Python 3.6+
+Works on Windows, Mac, and Linux with Python 3.8+
 """
 
+import asyncio
+import io
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import webbrowser
 import time
 import random
@@ -14,17 +18,174 @@ import string
 import re
 import sys
 import os
-from typing import List
+import json
+import pickle
+import socket
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Set
+
+# httpx with HTTP/2 support is optional; without it probes run on a thread pool
+try:
+    import httpx
+    import h2  # noqa: F401
+except ImportError:
+    httpx = None
+
+# NumPy is optional; it only speeds up generating ids in bulk
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 # Check Python version compatibility
-if sys.version_info < (3, 6):
-    print("❌ This script requires Python 3.6 or higher")
+if sys.version_info < (3, 8):
+    print("❌ This script requires Python 3.8 or higher")
     print(f"   You're running Python {sys.version_info.major}.{sys.version_info.minor}")
     sys.exit(1)
 
+# Cross-platform user agent
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# Default number of in-flight URL probes
+CONCURRENCY = 20
+
+# Default number of probes started per second
+RATE_LIMIT = 20
+
+# Seconds between browser tabs
+BROWSER_DELAY = 1.5
+
+# Bounds on the async pipeline's queues of generated ids and taken URLs
+ID_QUEUE_SIZE = 200
+BROWSER_QUEUE_SIZE = 50
+
+# Progress output is written in chunks of this size, or at least this often
+LOG_BUFFER_BYTES = 4096
+LOG_FLUSH_INTERVAL = 0.5
+
+# Ids of length 4-5 are mostly taken already, so generation favours the
+# longer lengths where available URLs are far more common
+URL_LENGTHS = [6, 7, 8]
+URL_LENGTH_WEIGHTS = [1, 3, 6]
+
+# URL ids probed in earlier runs are remembered here
+STATE_DIR = os.path.join(os.path.expanduser('~'), '.rentry_scanner')
+SEEN_FILE = os.path.join(STATE_DIR, 'seen.pkl')
+
+# Progress of an unfinished scan, saved every CHECKPOINT_EVERY attempts so it can be resumed
+CHECKPOINT_FILE = '.rentry_scan.json'
+CHECKPOINT_EVERY = 100
+
+# Every request targets this host, so its DNS lookup is cached for the whole run
+RENTRY_HOST = 'rentry.co'
+
+_original_getaddrinfo = socket.getaddrinfo
+_dns_cache = {}
+
+def _cached_getaddrinfo(host, *args, **kwargs):
+    """socket.getaddrinfo that only resolves rentry.co once per process"""
+    # anyio (used by httpx) passes the IDNA-encoded host as bytes
+    name = host.decode('ascii', 'replace') if isinstance(host, bytes) else host
+    if name != RENTRY_HOST:
+        return _original_getaddrinfo(host, *args, **kwargs)
+    key = (args, tuple(sorted(kwargs.items())))
+    if key not in _dns_cache:
+        _dns_cache[key] = _original_getaddrinfo(host, *args, **kwargs)
+    return _dns_cache[key]
+
+def enable_dns_cache():
+    """Route rentry.co lookups from requests and httpx through the cache"""
+    socket.getaddrinfo = _cached_getaddrinfo
+
+_TITLE_RE = re.compile(rb'<title>(.*?)</title>', re.IGNORECASE | re.DOTALL)
+
+# Titles and error markers sit near the top of the page, so only this much is read
+PAGE_HEAD_BYTES = 16384
+
+# HTML pages smaller than this are rentry's error/landing page rather than a paste
+SMALL_PAGE_BYTES = 2000
+
+# Result fields that depend only on the page body, and so can be cached per ETag
+_BODY_RESULT_KEYS = ('is_error_page', 'has_content', 'content_type', 'title')
+
+# Phrases that mark an error page
+ERROR_INDICATORS = [
+    'error',
+    '404 not found',
+    'page not found',
+    'not found',
+    'oops',
+    'something went wrong'
+]
+
+# Phrases that mark rentry-specific content
+RENTRY_INDICATORS = [
+    'rentry',
+    'markdown paste service',
+    'edit code',
+    'custom url',
+    'paste',
+    'markdown'
+]
+
+def _alternation(indicators: List[str]) -> bytes:
+    """Build a regex alternation matching any of the indicators literally"""
+    return b'|'.join(re.escape(indicator.encode('ascii')) for indicator in indicators)
+
+# Single case-insensitive alternation over the raw body bytes, so one scan
+# finds indicators of both kinds without decoding or lowercasing the page
+_INDICATOR_RE = re.compile(
+    b'(?P<error>' + _alternation(ERROR_INDICATORS) + b')'
+    b'|(?P<rentry>' + _alternation(RENTRY_INDICATORS) + b')',
+    re.IGNORECASE
+)
+
+def _checkpoint_count(count):
+    """JSON-friendly form of a scan's target; None stands for unlimited"""
+    return None if count == float('inf') else count
+
+class RateLimiter:
+    """Token bucket allowing `rate` requests every `per` seconds"""
+    
+    def __init__(self, rate: float, per: float = 1.0):
+        self.rate = rate
+        self.per = per
+        self._tokens = rate
+        self._updated = time.monotonic()
+        # Only guards the bookkeeping below, so it is safe to take from the event loop
+        self._lock = threading.Lock()
+    
+    def _reserve(self) -> float:
+        """Take a token and return how long to wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            refill = (now - self._updated) * self.rate / self.per
+            self._tokens = min(self.rate, self._tokens + refill)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens * self.per / self.rate
+    
+    def acquire(self):
+        """Block until a request may be sent"""
+        delay = self._reserve()
+        if delay:
+            time.sleep(delay)
+    
+    async def acquire_async(self):
+        """Wait without blocking the event loop until a request may be sent"""
+        delay = self._reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
 class RentryLinkGenerator:
     """Generator for random rentry.co link patterns"""
     
+    _CHARS = string.ascii_lowercase + string.digits
+    
     def __init__(self):
         # Common words for potential future use
         self.words = [
@@ -34,11 +195,22 @@ class RentryLinkGenerator:
             'cool', 'fast', 'slow', 'big', 'tiny', 'new', 'old', 'hot', 'cold', 'nice',
             'link', 'test', 'demo', 'temp', 'work', 'play', 'time', 'date', 'word', 'text'
         ]
+        if np is not None:
+            self._rng = np.random.default_rng()
+            self._charset = np.frombuffer(self._CHARS.encode('ascii'), dtype=np.uint8)
     
     def generate_random(self, length: int = 6) -> str:
         """Generate a random alphanumeric string"""
-        chars = string.ascii_lowercase + string.digits
-        return ''.join(random.choice(chars) for _ in range(length))
+        return ''.join(random.choices(self._CHARS, k=length))
+    
+    def generate_batch(self, count: int, length: int = 6) -> List[str]:
+        """Generate `count` random alphanumeric strings of the same length"""
+        if np is None:
+            return [self.generate_random(length) for _ in range(count)]
+        
+        # Sample every character at once, then view each row as one ASCII string
+        idx = self._rng.integers(0, len(self._CHARS), size=(count, length), dtype=np.uint8)
+        return self._charset[idx].view(f'S{length}').ravel().astype(str).tolist()
 
 class RentryContentExplorer:
     """Main content discovery and exploration engine"""
@@ -46,74 +218,260 @@ class RentryContentExplorer:
     def __init__(self):
         self.generator = RentryLinkGenerator()
         self.session = requests.Session()
-        # Cross-platform user agent
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+            'User-Agent': USER_AGENT,
+            'Connection': 'keep-alive'
         })
+        # Large keep-alive pool so repeated requests reuse TLS connections
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.attempts = 0
+        self._seen: Set[str] = self._load_seen()
+        # Ids generated by this scan, which is all the checkpoint needs to store
+        self._run_seen: Set[str] = set()
+        self._count = None
+        self._owns_checkpoint = False
+        self._results_filename = None
+        self._results_file = None
+        self._limiter = RateLimiter(RATE_LIMIT)
+        self._browser_queue: 'queue.Queue[str]' = queue.Queue()
+        self._etag_cache: Dict[str, dict] = {}
+        self._browser_thread = None
+        self._out = io.StringIO()
+        self._last_flush = time.monotonic()
+        # The browser thread logs too; reentrant because _log may flush
+        self._out_lock = threading.RLock()
+    
+    def _log(self, text: str):
+        """Buffer progress output, writing it to stdout in batches"""
+        with self._out_lock:
+            self._out.write(text)
+            if self._out.tell() > LOG_BUFFER_BYTES or time.monotonic() - self._last_flush > LOG_FLUSH_INTERVAL:
+                self._flush_log()
+    
+    def _flush_log(self):
+        """Write any buffered progress output to stdout"""
+        with self._out_lock:
+            if self._out.tell():
+                sys.stdout.write(self._out.getvalue())
+                sys.stdout.flush()
+                self._out.seek(0)
+                self._out.truncate()
+            self._last_flush = time.monotonic()
+    
+    def _browser_worker(self):
+        """Open queued URLs one at a time, spaced out so the browser keeps up"""
+        while True:
+            url = self._browser_queue.get()
+            try:
+                webbrowser.open(url)
+                time.sleep(BROWSER_DELAY)
+            except Exception as e:
+                # Flush right away so the error shows up after the progress lines before it
+                self._log(f"Could not open browser: {e}\n")
+                self._flush_log()
+            finally:
+                self._browser_queue.task_done()
+    
+    def _open_in_browser(self, url: str):
+        """Hand a URL to the background browser thread"""
+        if self._browser_thread is None:
+            self._browser_thread = threading.Thread(target=self._browser_worker, daemon=True)
+            self._browser_thread.start()
+        self._browser_queue.put(url)
+    
+    def _wait_for_browser(self):
+        """Let the browser thread finish opening queued URLs"""
+        if self._browser_thread is None or self._browser_queue.empty():
+            return
+        
+        print(f"🌐 Waiting for {self._browser_queue.qsize()} more browser tabs to open... (Ctrl+C to skip)")
+        try:
+            self._browser_queue.join()
+        except KeyboardInterrupt:
+            print("⛔ Skipped remaining browser tabs")
+    
+    def _load_seen(self) -> Set[str]:
+        """Load URL ids probed in earlier runs"""
+        try:
+            with open(SEEN_FILE, 'rb') as f:
+                return set(pickle.load(f))
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return set()
+    
+    def _save_seen(self):
+        """Persist probed URL ids so later runs skip them"""
+        try:
+            os.makedirs(STATE_DIR, exist_ok=True)
+            with open(SEEN_FILE, 'wb') as f:
+                pickle.dump(self._seen, f)
+        except OSError as e:
+            print(f"\n❌ Could not save probed URL cache: {e}")
+    
+    def _load_checkpoint(self, count, available_urls: List[str]):
+        """Restore the progress of an interrupted scan asking for the same number of URLs"""
+        try:
+            with open(CHECKPOINT_FILE, encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return
+        
+        # Its attempts count against this run's budget, so only resume a matching scan
+        if state.get('count') != _checkpoint_count(count):
+            print(f"💡 Ignoring '{CHECKPOINT_FILE}' from a scan with a different target")
+            return
+        
+        self._owns_checkpoint = True
+        self._run_seen.update(state.get('seen', []))
+        self._seen.update(self._run_seen)
+        available_urls.extend(state.get('available', []))
+        self.attempts = state.get('attempts', 0)
+        print(f"♻️  Resuming previous scan: {len(available_urls)} available URLs after {self.attempts} attempts")
+    
+    def _save_checkpoint(self, available_urls: List[str]) -> bool:
+        """Atomically write the scan's progress so it survives a crash or Ctrl+C"""
+        state = {
+            'count': _checkpoint_count(self._count),
+            'seen': list(self._run_seen),
+            'available': available_urls,
+            'attempts': self.attempts
+        }
+        tmp_file = CHECKPOINT_FILE + '.tmp'
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(state, f)
+            os.replace(tmp_file, CHECKPOINT_FILE)
+            self._owns_checkpoint = True
+            return True
+        except OSError as e:
+            self._log(f"Could not save checkpoint: {e}\n")
+            return False
+    
+    def _clear_checkpoint(self):
+        """Forget the checkpoint once a scan has run to completion"""
+        # Leave another scan's checkpoint alone unless this run resumed or replaced it
+        if not self._owns_checkpoint:
+            return
+        try:
+            os.remove(CHECKPOINT_FILE)
+        except OSError:
+            pass
+    
+    def _forget_url_id(self, url_id: str):
+        """Mark a generated id as unprobed so it can be tried later"""
+        self._seen.discard(url_id)
+        self._run_seen.discard(url_id)
+    
+    def _next_url_ids(self, count: int) -> List[str]:
+        """Generate `count` random URL ids that haven't been probed yet"""
+        url_ids = []
+        while len(url_ids) < count:
+            needed = count - len(url_ids)
+            lengths = random.choices(URL_LENGTHS, weights=URL_LENGTH_WEIGHTS, k=needed)
+            # One batch per length, drawn from in the order of `lengths` so the mix stays even
+            batches = {
+                length: iter(self.generator.generate_batch(lengths.count(length), length))
+                for length in set(lengths)
+            }
+            for length in lengths:
+                url_id = next(batches[length])
+                if url_id not in self._seen:
+                    self._seen.add(url_id)
+                    self._run_seen.add(url_id)
+                    url_ids.append(url_id)
+        return url_ids
+    
+    def _record_available(self, full_url: str, available_urls: List[str]):
+        """Keep an available URL and append it to the results file right away"""
+        available_urls.append(full_url)
+        if self._results_filename is None:
+            return
+        
+        try:
+            if self._results_file is None:
+                self._results_file = open(self._results_filename, "a", encoding='utf-8')
+            self._results_file.write(full_url + "\n")
+            self._results_file.flush()
+        except OSError as e:
+            # Stop writing incrementally; the report at the end will try again
+            self._log(f"Could not write to '{self._results_filename}': {e}\n")
+            self._results_filename = None
+    
+    def _cache_by_etag(self, etag: str, result: dict):
+        """Remember the body-derived part of a result under the page's ETag"""
+        if etag:
+            self._etag_cache[etag] = {key: result[key] for key in _BODY_RESULT_KEYS}
     
     def analyze_page_content(self, url: str) -> dict:
         """Analyze the page content to determine its status"""
         try:
-            response = self.session.get(url, timeout=10)
-            
-            result = {
-                'status_code': response.status_code,
-                'url': url,
-                'is_available': False,
-                'is_error_page': False,
-                'has_content': False,
-                'content_type': 'unknown',
-                'title': '',
-                'should_open': False
-            }
-            
-            content = response.text.lower()
+            with self.session.get(url, timeout=10, stream=True) as response:
+                result = {
+                    'status_code': response.status_code,
+                    'url': url,
+                    'is_available': False,
+                    'is_error_page': False,
+                    'has_content': False,
+                    'content_type': 'unknown',
+                    'title': '',
+                    'should_open': False
+                }
+                
+                # Anything but a 200 is decided by the status alone; skip the body
+                if response.status_code == 404:
+                    result['is_available'] = True
+                    result['content_type'] = 'available'
+                    return result
+                if response.status_code != 200:
+                    return result
+                
+                # A page seen before under the same ETag is classified without reading it
+                etag = response.headers.get('ETag')
+                if etag in self._etag_cache:
+                    result.update(self._etag_cache[etag])
+                    return result
+                
+                # A tiny HTML page is almost always the error/landing page
+                content_length = response.headers.get('Content-Length', '')
+                content_type = response.headers.get('Content-Type', '')
+                if (content_length.isdigit() and int(content_length) < SMALL_PAGE_BYTES
+                        and content_type.startswith('text/html')):
+                    result['is_error_page'] = True
+                    result['content_type'] = 'likely_error_page'
+                    self._cache_by_etag(etag, result)
+                    return result
+                
+                content = next(response.iter_content(PAGE_HEAD_BYTES), b'')
             
-            # Check for error pages
-            error_indicators = [
-                'error',
-                '404 not found',
-                'page not found',
-                'not found',
-                'oops',
-                'something went wrong'
-            ]
+            # Classify indicators in one pass, stopping once both kinds are seen
+            found = set()
+            for match in _INDICATOR_RE.finditer(content):
+                found.add(match.lastgroup)
+                if len(found) == 2:
+                    break
             
             # Check if it's an error page
-            if any(indicator in content for indicator in error_indicators):
+            if 'error' in found:
                 result['is_error_page'] = True
                 result['content_type'] = 'error_page'
             
-            # Check for rentry-specific content
-            rentry_indicators = [
-                'rentry',
-                'markdown paste service',
-                'edit code',
-                'custom url',
-                'paste',
-                'markdown'
-            ]
-            
             # Extract title
-            title_match = re.search(r'<title>(.*?)</title>', content)
+            title_match = _TITLE_RE.search(content)
             if title_match:
-                result['title'] = title_match.group(1).strip()
+                result['title'] = title_match.group(1).decode(response.encoding or 'utf-8', 'replace').strip()
             
-            # Determine if URL is available for use
-            if response.status_code == 404:
-                result['is_available'] = True
-                result['content_type'] = 'available'
-                result['should_open'] = False
-            elif response.status_code == 200:
-                # URL is taken, but check if it has actual content
-                if any(indicator in content for indicator in rentry_indicators):
-                    result['has_content'] = True
-                    result['content_type'] = 'taken_with_content'
-                    result['should_open'] = False
-                else:
-                    result['content_type'] = 'unknown_content'
-                    result['should_open'] = False
+            # URL is taken, but check if it has actual content
+            if 'rentry' in found:
+                result['has_content'] = True
+                result['content_type'] = 'taken_with_content'
+            else:
+                result['content_type'] = 'unknown_content'
             
+            self._cache_by_etag(etag, result)
             return result
             
         except requests.RequestException as e:
@@ -128,21 +486,189 @@ class RentryContentExplorer:
                 'should_open': False
             }
     
-    def test_url_availability(self, url_id: str) -> bool:
+    def _report_result(self, url_id: str, is_available: bool, open_browser: bool, available_urls: List[str]) -> bool:
+        """Print the outcome of one probe; returns True if the URL should be opened in the browser"""
+        self.attempts += 1
+        full_url = f"https://rentry.co/{url_id}"
+        
+        line = f"🔄 Attempt {self.attempts:2d}: Testing {full_url}... "
+        
+        if is_available:
+            self._log(line + "🔍 Available (404)\n")
+            self._record_available(full_url, available_urls)
+            should_open = False
+        elif open_browser:
+            # This URL has content, open it to see what's there
+            self._log(line + "📄 Taken - Opening in browser...\n")
+            should_open = True
+        else:
+            self._log(line + "📄 Taken - Has content\n")
+            should_open = False
+        
+        # Checkpoint only once this attempt's result has been recorded
+        if self.attempts % CHECKPOINT_EVERY == 0:
+            self._save_checkpoint(available_urls)
+        return should_open
+    
+    async def test_url_availability(self, client: 'httpx.AsyncClient', url_id: str) -> bool:
         """Test if URL returns 404 (available for use)"""
         full_url = f"https://rentry.co/{url_id}"
         
         try:
-            response = self.session.head(full_url, timeout=5, allow_redirects=True)
-            if response.status_code == 405:  # Method not allowed, try GET
-                response = self.session.get(full_url, timeout=5)
-            
+            # Only the status line is needed; the body is never read
+            async with client.stream('GET', full_url) as response:
+                return response.status_code == 404
+                
+        except httpx.HTTPError:
+            return False
+    
+    def test_url_availability_sync(self, url_id: str) -> bool:
+        """Blocking variant of test_url_availability used by the thread pool"""
+        full_url = f"https://rentry.co/{url_id}"
+        
+        try:
+            # Read the (small) body so urllib3 can return the connection to the pool;
+            # closing a streamed response early would drop the socket instead
+            response = self.session.get(full_url, timeout=5, allow_redirects=True)
             return response.status_code == 404
                 
         except requests.RequestException:
             return False
     
-    def explore_content(self, count, open_browser: bool = True, max_attempts: int = None):
+    def _probe_sync(self, url_id: str) -> bool:
+        """Test a URL from a worker thread once the rate limit allows"""
+        self._limiter.acquire()
+        return self.test_url_availability_sync(url_id)
+    
+    async def _explore_async(self, count, open_browser: bool, max_attempts, concurrency: int, available_urls: List[str]):
+        """Pipeline id generation, probing and browser opening through bounded queues"""
+        id_queue = asyncio.Queue(maxsize=ID_QUEUE_SIZE)
+        taken_queue = asyncio.Queue(maxsize=BROWSER_QUEUE_SIZE)
+        found_enough = asyncio.Event()
+        
+        async def producer():
+            """Keep the id queue topped up, then tell each worker to stop"""
+            remaining = max_attempts - self.attempts
+            while remaining > 0:
+                batch = self._next_url_ids(int(min(ID_QUEUE_SIZE // 2, remaining)))
+                for i, url_id in enumerate(batch):
+                    try:
+                        await id_queue.put(url_id)
+                    except asyncio.CancelledError:
+                        # Ids that never made it into the queue can be tried later
+                        for unqueued_id in batch[i:]:
+                            self._forget_url_id(unqueued_id)
+                        raise
+                remaining -= len(batch)
+            for _ in range(concurrency):
+                await id_queue.put(None)
+        
+        async def probe_worker(client: 'httpx.AsyncClient'):
+            """Probe ids from the queue; `concurrency` of these cap the requests in flight"""
+            while True:
+                url_id = await id_queue.get()
+                if url_id is None:
+                    return
+                if found_enough.is_set():
+                    self._forget_url_id(url_id)
+                    return
+                
+                try:
+                    await self._limiter.acquire_async()
+                    is_available = await self.test_url_availability(client, url_id)
+                except asyncio.CancelledError:
+                    # Never probed, so the id can be tried later
+                    self._forget_url_id(url_id)
+                    raise
+                
+                if found_enough.is_set():
+                    self._forget_url_id(url_id)
+                    return
+                if self._report_result(url_id, is_available, open_browser, available_urls):
+                    await taken_queue.put(f"https://rentry.co/{url_id}")
+                if len(available_urls) >= count:
+                    found_enough.set()
+        
+        async def browser_consumer():
+            """Hand taken URLs to the browser thread, which alone opens and paces tabs"""
+            while True:
+                self._open_in_browser(await taken_queue.get())
+        
+        # HTTP/2 multiplexes every probe over one connection; the limits only
+        # matter if the server falls back to HTTP/1.1
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        async with httpx.AsyncClient(
+            http2=True,
+            limits=limits,
+            timeout=5.0,
+            follow_redirects=True,
+            headers={'User-Agent': USER_AGENT}
+        ) as client:
+            tasks = [asyncio.ensure_future(producer())]
+            workers = [asyncio.ensure_future(probe_worker(client)) for _ in range(concurrency)]
+            tasks.extend(workers)
+            if open_browser:
+                tasks.append(asyncio.ensure_future(browser_consumer()))
+            
+            producer_task = tasks[0]
+            stop = asyncio.ensure_future(found_enough.wait())
+            all_workers = asyncio.gather(*workers)
+            tasks.extend([stop, all_workers])
+            try:
+                # Run until enough URLs are found or every attempt has been used
+                pending = {stop, all_workers, producer_task}
+                while stop in pending and all_workers in pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    # A crashed producer or worker would otherwise leave the scan hanging or
+                    # ending early; surface its error
+                    for task in done:
+                        if not task.cancelled() and task.exception():
+                            raise task.exception()
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                
+                # Ids that were generated but never probed can be tried later
+                while not id_queue.empty():
+                    self._forget_url_id(id_queue.get_nowait())
+                # Leave unopened taken URLs to the browser thread
+                while not taken_queue.empty():
+                    self._open_in_browser(taken_queue.get_nowait())
+    
+    def _explore_threaded(self, count, open_browser: bool, max_attempts, concurrency: int, available_urls: List[str]):
+        """Fallback for when httpx is unavailable: probe with a pool of worker threads"""
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            while len(available_urls) < count and self.attempts < max_attempts:
+                # Submit a window of probes; the pool caps how many run at once
+                window = int(min(concurrency * 2, max_attempts - self.attempts))
+                futures = {
+                    executor.submit(self._probe_sync, url_id): url_id
+                    for url_id in self._next_url_ids(window)
+                }
+                
+                reported = set()
+                try:
+                    for future in as_completed(futures):
+                        url_id = futures[future]
+                        reported.add(future)
+                        if self._report_result(url_id, future.result(), open_browser, available_urls):
+                            self._open_in_browser(f"https://rentry.co/{url_id}")
+                        if len(available_urls) >= count:
+                            break
+                finally:
+                    # Cancel probes that haven't started and forget every id whose result
+                    # was never reported, so it can be tried later
+                    for future, url_id in futures.items():
+                        future.cancel()
+                        if future not in reported:
+                            self._forget_url_id(url_id)
+        finally:
+            executor.shutdown(wait=False)
+    
+    def explore_content(self, count, open_browser: bool = True, max_attempts: int = None,
+                        concurrency: int = CONCURRENCY, rate: float = RATE_LIMIT):
         """Main content exploration function"""
         
         if max_attempts is None:
@@ -159,47 +685,44 @@ class RentryContentExplorer:
             print(f"🔍 Exploring rentry.co content (looking for {count} available URLs)...")
             print(f"📝 Method: random")
             print(f"🎯 Max attempts: {max_attempts}")
+        transport = "HTTP/2" if httpx is not None else "thread pool"
+        print(f"⚡ Concurrent requests: {concurrency} ({transport}) | Max {rate:g} requests/second")
         print("=" * 60)
         
         available_urls = []
-        attempts = 0
+        self.attempts = 0
+        self._limiter = RateLimiter(rate)
+        self._count = count
+        self._owns_checkpoint = False
+        self._load_checkpoint(count, available_urls)
+        
+        # Results file with cross-platform timestamp, appended to as URLs are found
+        timestamp = int(time.time())
+        filename = f"available_rentry_urls_{timestamp}.txt"
+        self._results_filename = filename
         
         try:
-            while len(available_urls) < count and attempts < max_attempts:
-                attempts += 1
-                
-                # Generate random URL
-                url_id = self.generator.generate_random(random.randint(4, 8))
-                full_url = f"https://rentry.co/{url_id}"
-                
-                print(f"🔄 Attempt {attempts:2d}: Testing {full_url}...", end=" ", flush=True)
-                
-                # Test URL status
-                is_available = self.test_url_availability(url_id)
-                
-                if is_available:
-                    print("🔍 Available (404)")
-                    available_urls.append(full_url)
-                else:
-                    print("📄 Taken - ", end="", flush=True)
-                    
-                    # This URL has content, open it to see what's there
-                    if open_browser:
-                        print("Opening in browser...")
-                        try:
-                            webbrowser.open(full_url)
-                            time.sleep(1.5)  # Delay between browser opens
-                        except Exception as e:
-                            print(f"Could not open browser: {e}")
-                    else:
-                        print("Has content")
-                
-                # Small delay to be respectful
-                time.sleep(0.3)
-                
+            if httpx is not None:
+                asyncio.run(self._explore_async(count, open_browser, max_attempts, concurrency, available_urls))
+            else:
+                self._explore_threaded(count, open_browser, max_attempts, concurrency, available_urls)
         except KeyboardInterrupt:
-            print(f"\n\n⛔ Stopped by user after {attempts} attempts")
+            self._flush_log()
+            print(f"\n\n⛔ Stopped by user after {self.attempts} attempts")
+            if self._save_checkpoint(available_urls):
+                print(f"💾 Progress saved to '{CHECKPOINT_FILE}' - run again to resume")
+        else:
+            self._clear_checkpoint()
+        finally:
+            self._flush_log()
+            if self._results_file is not None:
+                self._results_file.close()
+                self._results_file = None
+        
+        self._wait_for_browser()
+        self._save_seen()
         
+        attempts = self.attempts
         taken_count = attempts - len(available_urls)
         print("=" * 60)
         print(f"📊 Results: {len(available_urls)} available URLs | {taken_count} taken URLs | {attempts} total attempts")
@@ -209,23 +732,22 @@ class RentryContentExplorer:
             for i, url in enumerate(available_urls, 1):
                 print(f"   {i:2d}. {url}")
             
-            # Save to file with cross-platform timestamp
-            timestamp = int(time.time())
-            filename = f"available_rentry_urls_{timestamp}.txt"
+            # Replace the incremental list with the full report in a single write
+            lines = [
+                "Available Rentry.co URLs\n",
+                "=" * 30 + "\n",
+                f"Generated: {time.strftime('%Y-%m-%d %H:%M:%S')}\n",
+                f"Method: random\n",
+                f"Total attempts: {attempts}\n",
+                f"Success rate: {len(available_urls)/attempts*100:.1f}%\n\n",
+                "Available URLs (copy these to create new rentry.co pastes):\n",
+                "-" * 50 + "\n",
+                *[f"{i:2d}. {url}\n" for i, url in enumerate(available_urls, 1)]
+            ]
             
             try:
                 with open(filename, "w", encoding='utf-8') as f:
-                    f.write("Available Rentry.co URLs\n")
-                    f.write("=" * 30 + "\n")
-                    f.write(f"Generated: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-                    f.write(f"Method: random\n")
-                    f.write(f"Total attempts: {attempts}\n")
-                    f.write(f"Success rate: {len(available_urls)/attempts*100:.1f}%\n\n")
-                    
-                    f.write("Available URLs (copy these to create new rentry.co pastes):\n")
-                    f.write("-" * 50 + "\n")
-                    for i, url in enumerate(available_urls, 1):
-                        f.write(f"{i:2d}. {url}\n")
+                    f.write(''.join(lines))
                 
                 print(f"\n💾 Saved results to '{filename}'")
                 
@@ -240,13 +762,17 @@ def check_dependencies():
     """Check if required dependencies are installed"""
     try:
         import requests
-        return True
     except ImportError:
         print("❌ Missing required dependency: requests")
         print("\n📦 Please install it:")
         print("   pip install requests")
         print("   (or pip3 install requests)")
         return False
+    
+    if httpx is None:
+        print("💡 httpx/h2 not found - probing with a thread pool instead of HTTP/2")
+        print("   pip install httpx h2 (for faster scans)\n")
+    return True
 
 def get_user_input():
     """Get user preferences with cross-platform input handling"""
@@ -288,7 +814,43 @@ def get_user_input():
             print("\n\n⛔ Cancelled by user.")
             sys.exit(0)
     
-    return count, open_browser
+    # Ask how many requests to run at once
+    while True:
+        try:
+            concurrency_input = input(f"⚡ How many requests to run at once? (Enter for {CONCURRENCY}): ").strip()
+            if not concurrency_input:
+                concurrency = CONCURRENCY
+                break
+            concurrency = int(concurrency_input)
+            if concurrency > 0:
+                break
+            else:
+                print("❌ Please enter a positive number.")
+        except ValueError:
+            print("❌ Please enter a valid number.")
+        except (EOFError, KeyboardInterrupt):
+            print("\n\n⛔ Cancelled by user.")
+            sys.exit(0)
+    
+    # Ask how fast to send requests
+    while True:
+        try:
+            rate_input = input(f"⏱️  Max requests per second? (Enter for {RATE_LIMIT}): ").strip()
+            if not rate_input:
+                rate = RATE_LIMIT
+                break
+            rate = float(rate_input)
+            if rate > 0:
+                break
+            else:
+                print("❌ Please enter a positive number.")
+        except ValueError:
+            print("❌ Please enter a valid number.")
+        except (EOFError, KeyboardInterrupt):
+            print("\n\n⛔ Cancelled by user.")
+            sys.exit(0)
+    
+    return count, open_browser, concurrency, rate
 
 def main():
     """Main function with universal compatibility"""
@@ -296,9 +858,11 @@ def main():
     if not check_dependencies():
         sys.exit(1)
     
+    enable_dns_cache()
+    
     try:
         # Get user preferences
-        count, open_browser = get_user_input()
+        count, open_browser, concurrency, rate = get_user_input()
         
         print(f"\n🚀 Starting content exploration...")
         if open_browser:
@@ -311,7 +875,9 @@ def main():
         explorer = RentryContentExplorer()
         available_urls = explorer.explore_content(
             count=count,
-            open_browser=open_browser
+            open_browser=open_browser,
+            concurrency=concurrency,
+            rate=rate
         )
         
         if available_urls: